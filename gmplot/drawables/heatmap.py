@@ -1,6 +1,6 @@
 from collections import namedtuple
 
-from gmplot.utility import _get_value, _format_LatLng
+from gmplot.utility import _get_value, _format_LatLngs
 
 class _Heatmap(object):
     _DEFAULT_WEIGHT = 1
@@ -37,7 +37,7 @@ class _Heatmap(object):
         precision = _get_value(kwargs, ['precision'], 6)
         weights = _get_value(kwargs, ['weights'], [self._DEFAULT_WEIGHT] * len(lats))
 
-        self._points = [self._Point(_format_LatLng(lat, lng, precision), weight) for lat, lng, weight in zip(lats, lngs, weights)]
+        self._points = [self._Point(location, weight) for location, weight in zip(_format_LatLngs(lats, lngs, precision), weights)]
 
     def write(self, w):
         '''
@@ -1,5 +1,5 @@
 from gmplot.color import _get_hex_color
-from gmplot.utility import _get_value, _format_LatLng
+from gmplot.utility import _get_value, _format_LatLngs
 
 class _Polygon(object):
     def __init__(self, lats, lngs, **kwargs):
@@ -28,7 +28,7 @@ class _Polygon(object):
 
         precision = _get_value(kwargs, ['precision'], 6)
 
-        self._points = [_format_LatLng(lat, lng, precision) for lat, lng in zip(lats, lngs)]
+        self._points = _format_LatLngs(lats, lngs, precision)
 
     def write(self, w):
         '''
@@ -1,7 +1,12 @@
 from gmplot.color import _get_hex_color
 from gmplot.utility import _COLOR_ICON_PATH, _get_value, _format_LatLng, _get_embeddable_image
 
-class _Text(object):    
+_CLEAR_ICON = _get_embeddable_image(_COLOR_ICON_PATH % 'clear')
+
+class _Text(object):
+    __slots__ = ('_position', '_text', '_color')
+    _icon = _CLEAR_ICON
+
     def __init__(self, lat, lng, text, **kwargs):
         '''
         Args:
@@ -19,7 +24,6 @@ class _Text(object):
         self._position = _format_LatLng(lat, lng, precision)
         self._text = text
         self._color = _get_hex_color(_get_value(kwargs, ['color', 'c'], 'black'))
-        self._icon = _get_embeddable_image(_COLOR_ICON_PATH % 'clear')
 
     def write(self, w):
         '''
@@ -29,20 +33,15 @@ class _Text(object):
             w (_Writer): Writer used to write the text.
         '''
         w.write('''
-            new google.maps.Marker({{
-                label: {{
-                    text: "{text}",
-                    color: "{color}",
+            new google.maps.Marker({
+                label: {
+                    text: "%s",
+                    color: "%s",
                     fontWeight: "bold"
-                }},
-                icon: "{icon}",
-                position: {position},
+                },
+                icon: "%s",
+                position: %s,
                 map: map
-            }});
-        '''.format(
-            text=self._text,
-            color=self._color,
-            icon=self._icon,
-            position=self._position
-        ))
+            });
+        ''' % (self._text, self._color, self._icon, self._position))
         w.write()
@@ -59,6 +59,8 @@ def _get_value(dict, keys, default=None, get_key=False, pop=False):
             return value if not get_key else (key, value)
     return default if not get_key else (None, default)
 
+_LATLNG_FORMAT = 'new google.maps.LatLng(%.*f, %.*f)'
+
 def _format_LatLng(lat, lng, precision):
     '''
     Format the given latitude/longitude location as a Google Maps LatLng object.
@@ -71,7 +73,25 @@ def _format_LatLng(lat, lng, precision):
     Returns:
         str: Formatted Google Maps LatLng object.
     '''
-    return 'new google.maps.LatLng(%.*f, %.*f)' % (precision, lat, precision, lng)
+    return _LATLNG_FORMAT % (precision, lat, precision, lng)
+
+def _format_LatLngs(lats, lngs, precision):
+    '''
+    Format the given latitude/longitude locations as Google Maps LatLng objects.
+
+    Args:
+        lats ([float]): Latitudes.
+        lngs ([float]): Longitudes.
+        precision (int): Number of digits after the decimal to round to for lat/lng values.
+
+    Returns:
+        [str]: Formatted Google Maps LatLng objects.
+    '''
+    return [_LATLNG_FORMAT % (precision, lat, precision, lng) for lat, lng in zip(lats, lngs)]
+
+_EMBEDDABLE_IMAGE_PREFIX = b'data:image/png;base64,'
+_EMBEDDABLE_IMAGES = {}
+# Note: Cache of embeddable images, keyed by path, so that each image only gets read and encoded once.
 
 def _get_embeddable_image(path):
     '''
@@ -83,8 +103,13 @@ def _get_embeddable_image(path):
     Returns:
         str: Base64 image URL that can be embedded in a file.
     '''
-    with open(path, 'rb') as f:
-        return 'data:image/png;base64,' + base64.b64encode(f.read()).decode()
+    image = _EMBEDDABLE_IMAGES.get(path)
+    if image is None:
+        with open(path, 'rb') as f:
+            data = f.read()
+        image = (_EMBEDDABLE_IMAGE_PREFIX + base64.b64encode(data)).decode('ascii')
+        _EMBEDDABLE_IMAGES[path] = image
+    return image
 
 def _get_fresh_path(relative_path):
     '''
@@ -102,19 +127,21 @@ def _get_fresh_path(relative_path):
     os.mkdir(path)
     return path
 
-def _write_to_sidebar(file, name, link=None, depth=0):
+def _format_sidebar_item(name, link=None, depth=0):
     '''
-    Add an item to the GitHub Wiki _Sidebar file as a link.
+    Format an item as a link for the GitHub Wiki _Sidebar file.
 
     Args:
-        file (handle): _Sidebar file.
-        name (str): Readable name of the item to be added.
+        name (str): Readable name of the item.
 
     Optional:
 
     Args:
         link (str): Link to the item of interest. If not specified, the item name will be used as the link.
         depth (int): Indentation level of the given item in the _Sidebar. Defaults to 0.
+
+    Returns:
+        str: Formatted _Sidebar item.
     '''
     link_content = name
     if link is not None and name != link:
@@ -122,11 +149,25 @@ def _write_to_sidebar(file, name, link=None, depth=0):
     formatted_link = '[[%s]]' % link_content
 
     if depth == 0:
-        file.write(_bookend(formatted_link, '**') + '\n')
-    else:
-        file.write(_INDENT * (depth - 1) + '* ' + formatted_link)
-        
-    file.write('\n')
+        return _bookend(formatted_link, '**') + '\n\n'
+
+    return _INDENT * (depth - 1) + '* ' + formatted_link + '\n'
+
+def _write_to_sidebar(file, name, link=None, depth=0):
+    '''
+    Add an item to the GitHub Wiki _Sidebar file as a link.
+
+    Args:
+        file (handle): _Sidebar file.
+        name (str): Readable name of the item to be added.
+
+    Optional:
+
+    Args:
+        link (str): Link to the item of interest. If not specified, the item name will be used as the link.
+        depth (int): Indentation level of the given item in the _Sidebar. Defaults to 0.
+    '''
+    file.write(_format_sidebar_item(name, link, depth))
 
 class _GenerateDocFiles(object):
     '''
@@ -146,6 +187,7 @@ class _GenerateDocFiles(object):
         self.doc_directory = doc_directory
         self.source_ext = '.rst'
         self.sidebar_file = sidebar_file
+        self._sidebar_items = []
 
     def __call__(self):
         '''
@@ -153,6 +195,7 @@ class _GenerateDocFiles(object):
             str: The extension of the autogenerated Sphinx source files.
         '''
         self._recurse(self.module, [])
+        self.sidebar_file.writelines(self._sidebar_items)
         return self.source_ext
 
     def _recurse(self, element, ancestry):
@@ -199,7 +242,7 @@ class _GenerateDocFiles(object):
                 file.write('.. %s:: %s::%s\n' % (doc_type, self.module.__name__, full_name))
 
             # Add a link to this item in the _Sidebar file:
-            _write_to_sidebar(self.sidebar_file, name, full_name, len(ancestry))
+            self._sidebar_items.append(_format_sidebar_item(name, full_name, len(ancestry)))
 
             # Continue parsing the module tree:
             self._recurse(item, new_ancestry)
@@ -260,7 +303,7 @@ def _pretty_format_signature_header(signature_header):
     # Ensure the first portion of the header is a valid header level (e.g. '#' or '####'):
     header_level = header_sections[0]
     HEADER_CHARACTER = '#'
-    if header_level[0] != HEADER_CHARACTER or header_level != len(header_level) * header_level[0]:
+    if header_level.strip(HEADER_CHARACTER):
         return None
 
     # Get the annotation and full name portions of the header:
@@ -306,7 +349,31 @@ def _strip_character(string, character):
         return string
 
     escaped_character = '\\' + character
-    return escaped_character.join([fragment.replace(character, '') for fragment in string.split(escaped_character)])
+    fragments = []
+    start = 0
+    while True:
+        end = string.find(escaped_character, start)
+        if end == -1:
+            fragments.append(string[start:].replace(character, ''))
+            return ''.join(fragments)
+
+        fragments.append(string[start:end].replace(character, ''))
+        fragments.append(escaped_character)
+        start = end + len(escaped_character)
+
+_PARAMETER_REGEX = re.compile('(%s)(%s)(%s)' % (
+    r' *.*? ', # Matches whatever comes before the type, like: '''  * **origin** '''
+    r'\(.*\)', # Matches whatever makes up the type, like:     '''(*(**float**, **float**)*)'''
+    r' – .*'   # Matches whatever comes after the type, like:  ''' – Origin, in latitude/longitude.'''
+), flags=re.DOTALL)
+_LINE_REGEX = re.compile(r'( *)(.*)(\n)', flags=re.DOTALL)
+_IMAGE_REGEX = re.compile(r'!\[image]\((.*)\)', flags=re.DOTALL)
+_CODE_BLOCK_SYMBOL = '```'
+_HTML_OUTPUT_SYMBOL = '-> <html>'
+_MARKDOWN_ANCHOR_REGEX = re.compile(r'^(%s|%s|!\[image]\()' % (re.escape(_CODE_BLOCK_SYMBOL), re.escape(_HTML_OUTPUT_SYMBOL)), flags=re.MULTILINE)
+
+_FORMATTED_MARKDOWN_MARKER = '<!-- gmplot-formatted -->\n'
+# Note: Prepended to Markdown files once they've been pretty formatted, so that they don't get formatted twice.
 
 def _pretty_format_markdown(directory):
     '''
@@ -317,15 +384,19 @@ def _pretty_format_markdown(directory):
     '''
     _CODE_LITERAL_CHARACTER = '`'
 
-    for filename in os.listdir(directory):
+    for entry in os.scandir(directory):
+        filename = entry.name
 
         # Skip non-Markdown files:
-        if not filename.endswith(".md"):
+        if not filename.endswith(".md") or not entry.is_file():
             continue
 
-        # Read the file's contents:
-        with open(directory + filename, mode='r', encoding='utf-8') as file:
-            lines = file.readlines()
+        # Read the file's contents, skipping files that have already been formatted:
+        with open(entry.path, mode='r', encoding='utf-8') as file:
+            first_line = file.readline()
+            if first_line == _FORMATTED_MARKDOWN_MARKER:
+                continue
+            lines = [first_line] + file.readlines() if first_line else []
 
         # Skip if there's no content:
         if not lines:
@@ -339,40 +410,37 @@ def _pretty_format_markdown(directory):
         lines[0] += '\n'
 
         # Add a line break right after the header:
-        lines.insert(1, '\n')
-        lines.insert(2, '---\n')
-        lines.insert(3, '\n')
+        lines[1:1] = ('\n', '---\n', '\n')
 
         # Fuse the "Optional" header (if any) with the subsequent "Parameters" header:
-        while True:
-            index_optional = None
-            index_parameters = None
-            for index, line in enumerate(lines):
-                if index_optional is not None:
-                    if line == '* **Parameters**\n': 
-                        index_parameters = index
-                        break
-                    elif line != '\n':
-                        warnings.warn("Unexpected content after 'Optional' header!")
-                        break
-                elif line == 'Optional:\n':
-                    index_optional = index
-
-            if index_optional is not None and index_parameters is not None:
-                lines[index_optional] = '* **Optional Parameters**\n'
-                del lines[index_optional + 1 : index_parameters + 1]
-            else:
-                break # (don't do another pass if there are no more 'Optional/Parameters' pairs)
-            
-        # For each parameter line...
-        _PARAMETER_REGEX = '(%s)(%s)(%s)' % (
-            ' *.*? ', # Matches whatever comes before the type, like: '''  * **origin** '''
-            '\(.*\)', # Matches whatever makes up the type, like:     '''(*(**float**, **float**)*)'''
-            ' – .*'   # Matches whatever comes after the type, like:  ''' – Origin, in latitude/longitude.'''
-        )
-
+        fused_lines = []
+        index = 0
+        while index < len(lines):
+            if lines[index] == 'Optional:\n':
+                # Skip past any blank lines to find the "Parameters" header:
+                index_parameters = index + 1
+                while index_parameters < len(lines) and lines[index_parameters] == '\n':
+                    index_parameters += 1
+
+                if index_parameters < len(lines):
+                    if lines[index_parameters] == '* **Parameters**\n':
+                        fused_lines.append('* **Optional Parameters**\n')
+                        index = index_parameters + 1
+                        continue
+
+                    warnings.warn("Unexpected content after 'Optional' header!")
+
+            fused_lines.append(lines[index])
+            index += 1
+        lines = fused_lines
+
+        # Format the parameter lines in a single pass, keeping track of the 'Returns' and 'Return type' headers:
+        index_returns_header = None
+        index_return_type_header = None
         for index, line in enumerate(lines):
-            match = re.match(_PARAMETER_REGEX, line, flags=re.DOTALL)
+
+            # For each parameter line...
+            match = _PARAMETER_REGEX.match(line)
             if match:
                 sections = list(match.groups())
 
@@ -386,17 +454,14 @@ def _pretty_format_markdown(directory):
                 _OR_DELIMITER = ' or ' 
                 sections[1] = _OR_DELIMITER.join([_bookend(type_, _CODE_LITERAL_CHARACTER) for type_ in sections[1].split(_OR_DELIMITER)])
 
-                lines[index] = ''.join(sections)
+                line = lines[index] = ''.join(sections)
 
-        # Merge the 'Return type' content (if any) with the'Returns' content (if any):
-        index_returns_header = None
-        index_return_type_header = None
-        for index, line in enumerate(lines):
             if line == '* **Returns**\n':
                 index_returns_header = index
             elif line == '* **Return type**\n':
                 index_return_type_header = index
 
+        # Merge the 'Return type' content (if any) with the'Returns' content (if any):
         if index_return_type_header is not None:
             assert index_returns_header is not None, "'Returns' header must exist if 'Return type' header exists."
 
@@ -418,13 +483,11 @@ def _pretty_format_markdown(directory):
                     index_return_type_content = start_index + index
                     break
 
-            _LINE_REGEX = '( *)(.*)(\n)'
-
             # If there actually is 'Returns' content...
             if index_returns_content is not None:
 
                 # ...get the return type from the 'Return type' section:
-                match = re.match(_LINE_REGEX, lines[index_return_type_content], flags=re.DOTALL)
+                match = _LINE_REGEX.match(lines[index_return_type_content])
                 assert match, "'Return type' header must have some content below it."
                 return_type = match.groups()[1]
 
@@ -432,7 +495,7 @@ def _pretty_format_markdown(directory):
                 del lines[index_return_type_header : index_return_type_content + 1]
 
                 # ...prepend the return type to the 'Return' content.
-                match = re.match(_LINE_REGEX, lines[index_returns_content], flags=re.DOTALL)
+                match = _LINE_REGEX.match(lines[index_returns_content])
                 assert match, "'Return' header must have some content below it."
                 sections = list(match.groups())
                 sections[1] = _bookend(return_type, _CODE_LITERAL_CHARACTER) + ' – ' + sections[1]
@@ -442,7 +505,7 @@ def _pretty_format_markdown(directory):
             else:
 
                 # ...format the type as a code literal:
-                match = re.match(_LINE_REGEX, lines[index_return_type_content], flags=re.DOTALL)
+                match = _LINE_REGEX.match(lines[index_return_type_content])
                 assert match, "'Return type' header must have some content below it."
                 sections = list(match.groups())
                 sections[1] = _bookend(sections[1], _CODE_LITERAL_CHARACTER)
@@ -451,40 +514,50 @@ def _pretty_format_markdown(directory):
                 # ...delete the 'Return type' header and the extra lines that come before it:
                 del lines[index_returns_header + 1 : index_return_type_header + 1]
 
-        # Ensure all literal blocks get Python highlighting:
+        # Locate every code block symbol, HTML output block and embedded image with a single scan
+        # over the whole file's contents, then format the corresponding lines:
         in_literal_block = False
-        _CODE_BLOCK_SYMBOL = '```'
-        for index, line in enumerate(lines):
-            if line.startswith(_CODE_BLOCK_SYMBOL):
+        content = ''.join(lines)
+        index = 0
+        offset = 0
+        for match in _MARKDOWN_ANCHOR_REGEX.finditer(content):
+            index += content.count('\n', offset, match.start())
+            offset = match.start()
+            anchor = match.group(1)
+
+            # Ensure all literal blocks get Python highlighting:
+            if anchor == _CODE_BLOCK_SYMBOL:
+                # TODO: This temporary fix can be removed once the linked change appears in sphinx-markdown-builder's next release:
+                # https://github.com/codejamninja/sphinx-markdown-builder/pull/43
                 if not in_literal_block:
                     in_literal_block = True
                     lines[index] = _CODE_BLOCK_SYMBOL + 'python\n'
                 else:
                     in_literal_block = False
-        if in_literal_block:
-            warnings.warn('Unclosed literal block in `%s`.'  % filename)
-            continue
-        # TODO: This temporary fix can be removed once the linked change appears in sphinx-markdown-builder's next release:
-        # https://github.com/codejamninja/sphinx-markdown-builder/pull/43
 
-        # Ensure that HTML output blocks get HTML highlighting:
-        for index, line in enumerate(lines):
-            if line.startswith('-> <html>') and index > 0 and lines[index - 1].startswith(_CODE_BLOCK_SYMBOL):
-                lines[index - 1] = _CODE_BLOCK_SYMBOL + 'html\n'
-        # TODO: This temporary fix can be removed once the linked change appears in sphinx-markdown-builder's next release:
-        # https://github.com/codejamninja/sphinx-markdown-builder/pull/43
+            # Ensure that HTML output blocks get HTML highlighting:
+            elif anchor == _HTML_OUTPUT_SYMBOL:
+                # TODO: This temporary fix can be removed once the linked change appears in sphinx-markdown-builder's next release:
+                # https://github.com/codejamninja/sphinx-markdown-builder/pull/43
+                if index > 0 and lines[index - 1].startswith(_CODE_BLOCK_SYMBOL):
+                    lines[index - 1] = _CODE_BLOCK_SYMBOL + 'html\n'
 
-        # Ensure embedded images fit to the page:
-        for index, line in enumerate(lines):
-            match = re.match('!\[image]\((.*)\)', line, flags=re.DOTALL)
-            if match:
-                link = match.groups()[0]
+            # Ensure embedded images fit to the page:
+            else:
+                image_match = _IMAGE_REGEX.match(lines[index])
+                if image_match:
+                    link = image_match.groups()[0]
+
+                    if link.startswith('\\') or link.startswith('./'): # (make the image path absolute if it's relative)
+                        link = 'https://github.com/gmplot/gmplot/wiki/%s' % link[1:]
 
-                if link.startswith('\\') or link.startswith('./'): # (make the image path absolute if it's relative)
-                    link = 'https://github.com/gmplot/gmplot/wiki/%s' % link[1:]
+                    lines[index] = '[[%s | width = 100000px]]\n' % link
 
-                lines[index] = '[[%s | width = 100000px]]\n' % link
+        if in_literal_block:
+            warnings.warn('Unclosed literal block in `%s`.'  % filename)
+            continue
 
         # Update the file:
-        with open(directory + filename, mode='w', encoding='utf-8') as file:
+        with open(entry.path, mode='w', encoding='utf-8') as file:
+            file.write(_FORMATTED_MARKDOWN_MARKER)
             file.writelines(lines)
@@ -1,6 +1,6 @@
 import unittest
 import warnings
-from gmplot.utility import StringIO, _format_LatLng
+from gmplot.utility import StringIO, _format_LatLng, _format_LatLngs
 from gmplot.writer import _Writer
 from gmplot.drawables.route import _Route
 from gmplot.google_map_plotter import GoogleMapPlotter, InvalidSymbolError
@@ -11,6 +11,13 @@ class GMPlotTest(unittest.TestCase):
         self.assertEqual(_format_LatLng(45.123456, -80.987654, 4), 'new google.maps.LatLng(45.1235, -80.9877)')
         self.assertEqual(_format_LatLng(45.1, -80.9, 3), 'new google.maps.LatLng(45.100, -80.900)')
 
+    def test_format_LatLngs(self):
+        self.assertEqual(_format_LatLngs([45.123456, 45.1], [-80.987654, -80.9], 4), [
+            'new google.maps.LatLng(45.1235, -80.9877)',
+            'new google.maps.LatLng(45.1000, -80.9000)'
+        ])
+        self.assertEqual(_format_LatLngs([], [], 6), [])
+
 # Note: This test only ensures that Route's functions can be called without failing,
 #       it doesn't test if the resulting output can actually be rendered properly in a browser.
 class RouteTest(unittest.TestCase):
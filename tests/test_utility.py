@@ -1,5 +1,13 @@
+### Encoding: utf-8 (needed for Python 2)
+
+import io
+import os
+import sys
+import shutil
+import tempfile
 import unittest
-from gmplot.utility import StringIO
+import warnings
+from gmplot.utility import StringIO, _COLOR_ICON_PATH, _get_embeddable_image, _strip_character, _pretty_format_signature_header, _pretty_format_markdown, _FORMATTED_MARKDOWN_MARKER
 
 class StringIOTest(unittest.TestCase):
     def test_enter_exit(self):
@@ -8,3 +16,151 @@ class StringIOTest(unittest.TestCase):
             self.assertEqual(f.getvalue(), 'Content')
 
         self.assertTrue(f.closed) 
+
+class GetEmbeddableImageTest(unittest.TestCase):
+    def test_cached(self):
+        path = _COLOR_ICON_PATH % 'clear'
+        image = _get_embeddable_image(path)
+        self.assertTrue(image.startswith('data:image/png;base64,'))
+        self.assertIs(_get_embeddable_image(path), image)
+
+class StripCharacterTest(unittest.TestCase):
+    def test_strip(self):
+        self.assertEqual(_strip_character('*(**float**, **float**)*', '*'), '(float, float)')
+        self.assertEqual(_strip_character('*a\\*b*', '*'), 'a\\*b')
+        self.assertEqual(_strip_character('\\**\\*', '*'), '\\*\\*')
+        self.assertEqual(_strip_character('text', ''), 'text')
+
+class PrettyFormatSignatureHeaderTest(unittest.TestCase):
+    def test_format(self):
+        self.assertEqual(_pretty_format_signature_header('### class module.function(param1, param2=None)'), '_class_ module.**function**(_param1, param2=None_)')
+        self.assertEqual(_pretty_format_signature_header('# module.function()'), 'module.**function**()')
+
+    def test_invalid_header_level(self):
+        self.assertIsNone(_pretty_format_signature_header('#x# module.function()'))
+        self.assertIsNone(_pretty_format_signature_header('x## module.function()'))
+
+@unittest.skipIf(sys.version_info.major == 2, 'Markdown formatting requires Python 3.')
+class PrettyFormatMarkdownTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _format(self, filename, content):
+        path = os.path.join(self.directory, filename)
+        with io.open(path, mode='w', encoding='utf-8') as file:
+            file.write(content)
+
+        _pretty_format_markdown(self.directory)
+
+        with io.open(path, mode='r', encoding='utf-8') as file:
+            return file.read()
+
+    def test_format(self):
+        output = self._format('GoogleMapPlotter.draw.md', '''\
+### class gmplot.GoogleMapPlotter.draw(path, color=None)
+Draw the map.
+
+
+* **Parameters**
+
+    **path** (*str*) – Output path.
+
+
+Optional:
+
+
+* **Parameters**
+
+    **color** (*(**float**, **float**)* or *str*) – Color.
+
+
+* **Returns**
+
+![image](./draw.png)
+
+
+
+* **Return type**
+
+    str
+
+
+Usage:
+
+```
+gmap.draw('map.html')
+```
+
+```
+-> <html>...</html>
+```
+
+![image](./images/draw.png)
+''')
+
+        EXPECTED_OUTPUT = '''\
+_class_ gmplot.GoogleMapPlotter.**draw**(_path, color=None_)
+
+---
+
+Draw the map.
+
+
+* **Parameters**
+
+    **path** `str` – Output path.
+
+
+* **Optional Parameters**
+
+    **color** `(float, float)` or `str` – Color.
+
+
+* **Returns**
+
+`str` – ![image](./draw.png)
+
+
+
+
+
+Usage:
+
+```python
+gmap.draw('map.html')
+```
+
+```html
+-> <html>...</html>
+```
+
+[[https://github.com/gmplot/gmplot/wiki//images/draw.png | width = 100000px]]
+'''
+
+        self.assertEqual(output, _FORMATTED_MARKDOWN_MARKER + EXPECTED_OUTPUT)
+
+    def test_skip_formatted(self):
+        path = os.path.join(self.directory, 'GoogleMapPlotter.draw.md')
+        output = self._format('GoogleMapPlotter.draw.md', '### gmplot.GoogleMapPlotter.draw(path)\nDraw the map.\n')
+        self.assertTrue(output.startswith(_FORMATTED_MARKDOWN_MARKER))
+
+        with io.open(path, mode='rb') as file:
+            formatted_content = file.read()
+
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            _pretty_format_markdown(self.directory)
+
+        self.assertEqual(caught_warnings, [])
+        with io.open(path, mode='rb') as file:
+            self.assertEqual(file.read(), formatted_content)
+
+    def test_unparsable_header_not_marked(self):
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            output = self._format('invalid.md', '### invalid\nContent.\n')
+
+        self.assertEqual(output, '### invalid\nContent.\n')